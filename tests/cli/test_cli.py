@@ -43,10 +43,74 @@ import json
 import secrets
 import datetime
 import time
+import hashlib
+import threading
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from tests.common.utils import load_configuration
 
+
+class FailingProxy:
+    """
+    Local HTTP proxy forwarding all requests to the IDA service, except that the specified number of GET requests
+    for pathnames ending with the specified suffix fail, either by being answered with an HTTP error status and an
+    HTML error page, as an unavailable service or intermediate proxy would answer them, or, if ignore_range is
+    True, by being forwarded without any Range header, such that the entire file is returned.
+    """
+
+    def __init__(self, ida_host, suffix, failures=1, status=503, ignore_range=False):
+        self.ida_host = ida_host
+        self.suffix = suffix
+        self.failures = failures
+        self.status = status
+        self.ignore_range = ignore_range
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def forward(self):
+                excluded = ["host"]
+                if self.command == "GET" and self.path.split("?")[0].endswith(proxy.suffix) and proxy.failures > 0:
+                    proxy.failures -= 1
+                    if proxy.ignore_range:
+                        excluded.append("range")
+                    else:
+                        body = b"<html><body><h1>Service Unavailable</h1></body></html>"
+                        self.send_response(proxy.status)
+                        self.send_header("Content-Type", "text/html")
+                        self.send_header("Content-Length", str(len(body)))
+                        self.end_headers()
+                        self.wfile.write(body)
+                        return
+                headers = {key: value for key, value in self.headers.items() if key.lower() not in excluded}
+                length = int(self.headers.get("Content-Length", 0))
+                data = self.rfile.read(length) if length > 0 else None
+                response = requests.request(self.command, "%s%s" % (proxy.ida_host, self.path), headers=headers,
+                                            data=data, verify=False, allow_redirects=False)
+                self.send_response(response.status_code)
+                for key, value in response.headers.items():
+                    if key.lower() not in ("content-length", "content-encoding", "transfer-encoding", "connection"):
+                        self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            def log_message(self, format, *args):
+                pass
+
+        for method in ("GET", "HEAD", "POST", "PUT", "DELETE", "PROPFIND", "MKCOL", "MOVE", "COPY"):
+            setattr(Handler, "do_%s" % method, Handler.forward)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.host = "http://127.0.0.1:%d" % self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
 class TestIdaCli(unittest.TestCase):
 
     @classmethod
@@ -118,6 +182,10 @@ class TestIdaCli(unittest.TestCase):
         # Prefix IDA CLI script pathname with environment variable allowing use of modified script
         self.cli_cmd = "ALLOW_MODIFIED_SCRIPT=\"true\" %s" % self.cli_cmd
 
+        # Prefix IDA CLI script pathname with a cache folder within the temporary folder, so that the checksum cache,
+        # inventory snapshots, and journals used by the tests are isolated from those of the user running the tests
+        self.cli_cmd = "IDA_CACHE_DIR=\"%s/cache\" %s" % (self.tempdir, self.cli_cmd)
+
         # Prefix IDA CLI script pathname with user password from configuration if netrc not being used.
         # This prevents a user's actual password taken from a home configuration from being included in
         # any of the temporary configuration files generated as part of these tests
@@ -480,7 +548,62 @@ class TestIdaCli(unittest.TestCase):
             self.assertIn("Error: The -i option is not allowed for the specified action", output)
         self.assertTrue(failed, output)
 
-        print("Attempt to use -i parameter with validate action")
+        print("Attempt to use -N parameter with copy action")
+        cmd = "%s copy %s -N /test%s/2017-08 /test%s/2017-08b" % (self.cli_cmd, self.args, self.token, self.token)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -N option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -m parameter with upload action")
+        cmd = "%s upload %s -m /test%s/2017-08 %s/2017-08" % (self.cli_cmd, self.args, self.token, self.testdata)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -m option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -m and -x parameters together with download action")
+        cmd = "%s download %s -m -x /test%s/2017-08 %s/2017-08" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -m and -x options cannot be used together", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -d parameter with copy action")
+        cmd = "%s copy %s -d /test%s/2017-08 /test%s/2017-08b" % (self.cli_cmd, self.args, self.token, self.token)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -d option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -P parameter with diff action")
+        cmd = "%s diff %s -P 4 /test%s/2017-08 ./2017-08" % (self.cli_cmd, self.args, self.token)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -P option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to validate using non-existent ignore file")
         cmd = "%s validate %s -i ./ignore /file ./file" % (self.cli_cmd, self.args)
         failed = False
         try:
@@ -488,7 +611,7 @@ class TestIdaCli(unittest.TestCase):
         except subprocess.CalledProcessError as error:
             failed = True
             output = error.output.decode(sys.stdout.encoding)
-            self.assertIn("Error: The -i option is not allowed for the specified action", output)
+            self.assertIn("Error: Can't find specified ignore file", output)
         self.assertTrue(failed, output)
 
         print("Attempt to use -i parameter with info action")
@@ -634,6 +757,94 @@ class TestIdaCli(unittest.TestCase):
             self.assertIn("Error: The -j option is not allowed for the specified action", output)
         self.assertTrue(failed, output)
 
+        print("Attempt to use -l parameter with info action")
+        cmd = "%s info %s -l /file" % (self.cli_cmd, self.args)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -l option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -k parameter with inventory action without -l parameter")
+        cmd = "%s inventory %s -k pathname,size" % (self.cli_cmd, self.args)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -k option and target pathname are only allowed for the inventory action with the -l option", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -R parameter with download action")
+        cmd = "%s download %s -R /file ./file" % (self.cli_cmd, self.args)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -R option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -r parameter with validate action")
+        cmd = "%s validate %s -r /file ./file" % (self.cli_cmd, self.args)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -r option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -P parameter with copy action")
+        cmd = "%s copy %s -P 4 /file /file2" % (self.cli_cmd, self.args)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -P option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -F parameter with sync action")
+        cmd = "%s sync %s -F /test%s/2017-08 %s/2017-08" % (self.cli_cmd, self.args, self.token, self.testdata)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -F option is not allowed for the specified action", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use -P parameter with invalid number of workers")
+        cmd = "%s upload %s -P none /test%s/2017-08 %s/2017-08" % (self.cli_cmd, self.args, self.token, self.testdata)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: Invalid number of parallel workers", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to use invalid scope check operations")
+        cmd = "IDA_SCOPE_CHECK_OPERATIONS=0 %s upload %s /test%s/2017-08 %s/2017-08" % (self.cli_cmd, self.args, self.token, self.testdata)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: Invalid scope check operations", output)
+        self.assertTrue(failed, output)
+
         print("Attempt to use project name with invalid characters")
         cmd = "%s info %s -p bad@project:name+ /" % (self.cli_cmd, self.info_args)
         failed = False
@@ -961,6 +1172,42 @@ class TestIdaCli(unittest.TestCase):
             self.fail(error.output.decode(sys.stdout.encoding))
         self.assertIn("FILE_OK: local file %s/Contact.txt matches file in IDA at /%s+/test%s/Contact.txt" % (self.testdata, self.test_project_name, self.token), output)
 
+        print("Validate file using checksum recorded in local checksum cache")
+        stat = os.stat("%s/Contact.txt" % self.testdata)
+        cache_entry = Path("%s/cache/checksums/%d/%d" % (self.tempdir, stat.st_dev, stat.st_ino))
+        cache_entry.parent.mkdir(parents=True, exist_ok=True)
+        cache_entry.write_text("%d %d %d %s\n" % (stat.st_size, int(stat.st_mtime), int(stat.st_ctime), "0" * 64))
+        cmd = "%s validate %s /test%s/Contact.txt %s/Contact.txt" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("INVALID: local file %s/Contact.txt checksum %s does not match IDA file checksum" % (self.testdata, "0" * 64), output)
+
+        print("Validate file bypassing local checksum cache")
+        cmd = "%s validate %s -N /test%s/Contact.txt %s/Contact.txt" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/Contact.txt matches file in IDA at /%s+/test%s/Contact.txt" % (self.testdata, self.test_project_name, self.token), output)
+
+        print("Validate file using deep validation, ignoring local checksum cache")
+        cmd = "%s validate %s -d /test%s/Contact.txt %s/Contact.txt" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/Contact.txt matches file in IDA at /%s+/test%s/Contact.txt (verified by checksum)" % (self.testdata, self.test_project_name, self.token), output)
+
+        print("Validate file using checksum recorded in local checksum cache by deep validation")
+        cmd = "%s validate %s /test%s/Contact.txt %s/Contact.txt" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/Contact.txt matches file in IDA at /%s+/test%s/Contact.txt (verified by cached checksum)" % (self.testdata, self.test_project_name, self.token), output)
+
         print("Create variant of file in IDA with same size but modified so that checksum is different")
         cmd = "cat %s/Contact.txt | tr 'a-z' 'A-Z' > /tmp/Contact.txt" % self.testdata
         try:
@@ -1302,11 +1549,119 @@ class TestIdaCli(unittest.TestCase):
             output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
         except subprocess.CalledProcessError as error:
             self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Downloaded file verified by checksum", output)
         self.assertIn("Target downloaded successfully", output)
         path = Path("%s/a/b/c/Contact.txt" % (self.tempdir))
         self.assertTrue(path.is_file(), output)
         self.assertEquals(2263, path.stat().st_size, output)
 
+        print("Download file discarding partial file of unknown download")
+        path = Path("%s/a/b/c/Contact2.txt.part" % (self.tempdir))
+        path.write_text("unknown")
+        cmd = "%s download %s /test%s/x/y/z/Contact.txt %s/a/b/c/Contact2.txt" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Discarding partial file %s/a/b/c/Contact2.txt.part" % (self.tempdir), output)
+        self.assertIn("Target downloaded successfully", output)
+        self.assertFalse(path.exists(), output)
+        path = Path("%s/a/b/c/Contact2.txt" % (self.tempdir))
+        self.assertTrue(path.is_file(), output)
+        self.assertEquals(2263, path.stat().st_size, output)
+
+        print("Download file resuming interrupted download from partial file")
+        cmd = "%s download %s /test%s/x/y/z/Contact.txt %s/a/b/c/Contact3.txt" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Download journal: %s/cache/downloads/" % (self.tempdir), output)
+        journal = Path([line for line in output.splitlines() if line.startswith("Download journal: ")][0][len("Download journal: "):])
+        self.assertFalse(journal.exists(), output)
+        contents = Path("%s/a/b/c/Contact.txt" % (self.tempdir)).read_bytes()
+        os.remove("%s/a/b/c/Contact3.txt" % (self.tempdir))
+        journal.write_text("%d %s 0\n" % (len(contents), hashlib.sha256(contents).hexdigest()))
+        path = Path("%s/a/b/c/Contact3.txt.part" % (self.tempdir))
+        path.write_bytes(contents[:1000])
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Resuming interrupted download to %s/a/b/c/Contact3.txt.part" % (self.tempdir), output)
+        self.assertIn("Resuming download from byte 1000 of 2263", output)
+        self.assertIn("Target downloaded successfully", output)
+        self.assertFalse(path.exists(), output)
+        self.assertFalse(journal.exists(), output)
+        path = Path("%s/a/b/c/Contact3.txt" % (self.tempdir))
+        self.assertEqual(contents, path.read_bytes(), output)
+
+        print("Download file after first request fails with HTTP error")
+        proxy = FailingProxy(self.ida_host, "/Contact.txt")
+        f = open("%s/ida-config-proxy" % self.tempdir, "w")
+        f.write("IDA_HOST=\"%s\"\n" % proxy.host)
+        f.write("IDA_PROJECT=\"%s\"\n" % self.test_project_name)
+        f.write("IDA_USERNAME=\"%s\"\n" % self.test_user_name)
+        f.close()
+        proxy_cmd = "IDA_PASSWORD=\"%s\" %s download -V -c %s/ida-config-proxy /test%s/x/y/z/Contact.txt %s/a/b/c/Contact4.txt" % (self.test_user_pass, self.cli_cmd, self.tempdir, self.token, self.tempdir)
+        failed = False
+        try:
+            output = subprocess.check_output(proxy_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: GET request failed", output)
+            self.assertIn(": 503", output)
+        self.assertTrue(failed, output)
+        self.assertNotIn("Partial file %s/a/b/c/Contact4.txt.part retained" % (self.tempdir), output)
+        path = Path("%s/a/b/c/Contact4.txt.part" % (self.tempdir))
+        self.assertFalse(path.exists(), output)
+        path.write_bytes(contents[:1000])
+        proxy.failures = 1
+        failed = False
+        try:
+            output = subprocess.check_output(proxy_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Resuming download from byte 1000 of 2263", output)
+            self.assertIn(": 503", output)
+        self.assertTrue(failed, output)
+        self.assertIn("Partial file %s/a/b/c/Contact4.txt.part retained" % (self.tempdir), output)
+        self.assertEqual(contents[:1000], path.read_bytes(), output)
+        try:
+            output = subprocess.check_output(proxy_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            proxy.stop()
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Resuming download from byte 1000 of 2263", output)
+        self.assertIn("Downloaded file verified by checksum", output)
+        self.assertFalse(path.exists(), output)
+        path = Path("%s/a/b/c/Contact4.txt" % (self.tempdir))
+        self.assertEqual(contents, path.read_bytes(), output)
+
+        print("Download file discarding partial file larger than file in IDA")
+        os.remove("%s/a/b/c/Contact4.txt" % (self.tempdir))
+        proxy.failures = 1
+        try:
+            output = subprocess.check_output(proxy_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            output = error.output.decode(sys.stdout.encoding)
+        path = Path("%s/a/b/c/Contact4.txt.part" % (self.tempdir))
+        self.assertFalse(path.exists(), output)
+        path.write_bytes(contents + b"<html><body><h1>Service Unavailable</h1></body></html>")
+        try:
+            output = subprocess.check_output(proxy_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        finally:
+            proxy.stop()
+        self.assertIn("Discarding partial file %s/a/b/c/Contact4.txt.part, as it is larger than the file in IDA" % (self.tempdir), output)
+        self.assertIn("Downloaded file verified by checksum", output)
+        self.assertFalse(path.exists(), output)
+        path = Path("%s/a/b/c/Contact4.txt" % (self.tempdir))
+        self.assertEqual(contents, path.read_bytes(), output)
+
         print("Attempt to upload file using invalid local pathname")
         cmd = "%s upload %s /test%s/no/such/file.txt /no/such/file.txt" % (self.cli_cmd, self.args, self.token)
         failed = False
@@ -1582,6 +1937,277 @@ class TestIdaCli(unittest.TestCase):
             path = Path("%s/test%s/2017-10/Experiment_3/.hidden_file" % (self.staging, self.token))
             self.assertFalse(path.exists(), output)
 
+        print("Upload folder with ignore patterns pruning folders")
+        ignore_file = "%s/ida-ignore" % self.tempdir
+        with open(ignore_file, "w") as f:
+            f.write("# Excluded folders\nExperiment_4/\n\n# Excluded files\n  test05.dat  \nzero_size_*\n")
+        cmd = "%s upload %s -i %s /test%s/Pruned %s/2017-10" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FIND PRUNE: -type d ( -name Experiment_4 ) -prune -o", output)
+        self.assertIn("FIND EXCLUDE: ! -name test05.dat ! -name zero_size_*", output)
+        self.assertIn("Target uploaded successfully", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/Pruned/Experiment_3/baseline/test01.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            path = Path("%s/test%s/Pruned/Experiment_3/baseline/test05.dat" % (self.staging, self.token))
+            self.assertFalse(path.exists(), output)
+            path = Path("%s/test%s/Pruned/Experiment_3/zero_size_file" % (self.staging, self.token))
+            self.assertFalse(path.exists(), output)
+            path = Path("%s/test%s/Pruned/Experiment_4" % (self.staging, self.token))
+            self.assertFalse(path.exists(), output)
+
+        print("Validate folder with ignore patterns pruning folders")
+        cmd = "%s validate %s -i %s /test%s/Pruned %s/2017-10" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/2017-10/Experiment_3/baseline/test01.dat" % self.testdata, output)
+        self.assertNotIn("FILE_OK: local file %s/2017-10/Experiment_4/" % self.testdata, output)
+        self.assertNotIn("MISSING:", output)
+        self.assertIn("Remote listing of /%s+/test%s/Pruned contains" % (self.test_project_name, self.token), output)
+        self.assertNotIn("PROPFIND: ", output)
+
+        print("Validate folder using parallel workers, reporting results in the same order as a single worker")
+        cmd = "%s validate %s -i %s /test%s/Pruned %s/2017-10 2>/dev/null" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            expected_output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        cmd = "%s validate %s -i %s -P 4 /test%s/Pruned %s/2017-10 2>/dev/null" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/2017-10/Experiment_3/baseline/test01.dat" % self.testdata, output)
+        self.assertEqual(expected_output, output)
+
+        print("Validate folder in tiers, generating checksums only for files without cached checksums")
+        shutil.rmtree("%s/cache/checksums" % self.tempdir, ignore_errors=True)
+        cmd = "%s validate %s -i %s /test%s/Pruned %s/2017-10" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/2017-10/Experiment_3/baseline/test01.dat matches file in IDA at /%s+/test%s/Pruned/Experiment_3/baseline/test01.dat (verified by checksum)" % (self.testdata, self.test_project_name, self.token), output)
+        self.assertIn("Validating 0 files by size or cached checksum", output)
+        cmd = "%s validate %s -i %s /test%s/Pruned %s/2017-10" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/2017-10/Experiment_3/baseline/test01.dat matches file in IDA at /%s+/test%s/Pruned/Experiment_3/baseline/test01.dat (verified by cached checksum)" % (self.testdata, self.test_project_name, self.token), output)
+        self.assertIn("and 0 files by checksum", output)
+
+        print("Validate folder using deep validation, generating checksums for all files")
+        cmd = "%s validate %s -d -i %s /test%s/Pruned %s/2017-10" % (self.cli_cmd, self.args, ignore_file, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/2017-10/Experiment_3/baseline/test01.dat matches file in IDA at /%s+/test%s/Pruned/Experiment_3/baseline/test01.dat (verified by checksum)" % (self.testdata, self.test_project_name, self.token), output)
+        self.assertNotIn("(verified by cached checksum)", output)
+
+        print("Compare folder with local folder in both directions")
+        diff_folder = "%s/diff" % self.tempdir
+        shutil.copytree("%s/2017-10/Experiment_3" % self.testdata, diff_folder)
+        os.remove("%s/baseline/test01.dat" % diff_folder)
+        with open("%s/test02.dat" % diff_folder, "a") as f:
+            f.write("modified")
+        with open("%s/test03.dat" % diff_folder, "r+") as f:
+            f.write("X")
+        cmd = "%s diff %s /test%s/Pruned/Experiment_3 %s" % (self.cli_cmd, self.args, self.token, diff_folder)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("REMOTE_ONLY: file in IDA at /%s+/test%s/Pruned/Experiment_3/baseline/test01.dat does not exist locally at %s/baseline/test01.dat" % (self.test_project_name, self.token, diff_folder), output)
+        self.assertIn("LOCAL_ONLY: local file %s/test05.dat does not exist in IDA at /%s+/test%s/Pruned/Experiment_3/test05.dat" % (diff_folder, self.test_project_name, self.token), output)
+        self.assertIn("SIZE_MISMATCH: local file %s/test02.dat size" % diff_folder, output)
+        self.assertIn("CHECKSUM_MISMATCH: local file %s/test03.dat checksum" % diff_folder, output)
+        self.assertIn("IDENTICAL: local file %s/test04.dat matches file in IDA at /%s+/test%s/Pruned/Experiment_3/test04.dat" % (diff_folder, self.test_project_name, self.token), output)
+        self.assertIn("Local only: 4, remote only: 1, size mismatch: 1, checksum mismatch: 1, identical: 6", output)
+
+        print("Upload folder using parallel workers")
+        cmd = "%s upload %s -P 4 /test%s/2017-08/Experiment_1/baseline7 %s/2017-08/Experiment_2/baseline" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files uploaded: 6, skipped: 0, failed: 0", output)
+        self.assertIn("Target uploaded successfully", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/2017-08/Experiment_1/baseline7" % (self.staging, self.token))
+            self.assertTrue(path.is_dir(), output)
+            path = Path("%s/test%s/2017-08/Experiment_1/baseline7/test01.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            self.assertEquals(446, path.stat().st_size, output)
+            path = Path("%s/test%s/2017-08/Experiment_1/baseline7/zero_size_file" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            self.assertEquals(0, path.stat().st_size, output)
+
+        print("Upload existing folder using parallel workers, which will skip all files")
+        cmd = "%s upload %s -P 4 /test%s/2017-08/Experiment_1/baseline7 %s/2017-08/Experiment_2/baseline" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files uploaded: 0, skipped: 6, failed: 0", output)
+        self.assertIn("WARNING: one or more files were skipped", output)
+
+        print("Upload folder in multiple batches using a single worker")
+        cmd = "IDA_BATCH_SIZE=4 %s upload %s /test%s/2017-08/Experiment_1/baseline8 %s/2017-08/Experiment_2/baseline" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Starting checksum pipeline with lookahead of 8 files", output)
+        self.assertIn("Target uploaded successfully", output)
+        self.assertEqual(6, output.count("Uploading file %s/2017-08/Experiment_2/baseline/" % (self.testdata)), output)
+        self.assertNotIn("Error:", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/2017-08/Experiment_1/baseline8/test01.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            self.assertEquals(446, path.stat().st_size, output)
+            path = Path("%s/test%s/2017-08/Experiment_1/baseline8/test05.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            self.assertEquals(446, path.stat().st_size, output)
+
+        print("Validate folder uploaded in multiple batches")
+        cmd = "%s validate %s /test%s/2017-08/Experiment_1/baseline8 %s/2017-08/Experiment_2/baseline" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertEqual(6, output.count("FILE_OK: local file %s/2017-08/Experiment_2/baseline/" % (self.testdata)), output)
+        self.assertNotIn("MISSING", output)
+        self.assertNotIn("INVALID", output)
+
+        print("Upload folder creating missing folders concurrently")
+        cmd = "%s upload %s -P 4 /test%s/Nested/2017-10 %s/2017-10" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Creating 1 missing folders", output)
+        self.assertIn("Creating 8 missing folders", output)
+        self.assertIn("Creating target folder /%s+/test%s/Nested/2017-10/Experiment_3/baseline" % (self.test_project_name, self.token), output)
+        self.assertIn("Target uploaded successfully", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/Nested/2017-10/Experiment_3/baseline/test01.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+
+        print("Re-upload folder without creating any existing folders")
+        cmd = "%s upload %s -P 4 /test%s/Nested/2017-10 %s/2017-10" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Creating 0 missing folders", output)
+        self.assertNotIn("Creating target folder", output)
+
+        print("Synchronize folder")
+        sync_folder = "%s/sync" % self.tempdir
+        shutil.copytree("%s/2017-10" % self.testdata, sync_folder)
+        cmd = "%s sync %s -P 4 /test%s/Synchronized %s" % (self.cli_cmd, self.args, self.token, sync_folder)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files unchanged since last synchronization: 0, new or modified: 38", output)
+        self.assertIn("Files uploaded: 38, skipped: 0, failed: 0", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/Synchronized/Experiment_3/baseline/test01.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+
+        print("Synchronize unchanged folder without uploading any files")
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files unchanged since last synchronization: 38, new or modified: 0", output)
+        self.assertNotIn("PROPFIND", output)
+        self.assertNotIn("Uploading file", output)
+
+        print("Synchronize folder with modified file")
+        with open("%s/Experiment_3/baseline/test01.dat" % sync_folder, "a") as f:
+            f.write("modified")
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files unchanged since last synchronization: 37, new or modified: 1", output)
+        self.assertIn("Uploading file %s/Experiment_3/baseline/test01.dat" % sync_folder, output)
+        self.assertIn("Files uploaded: 1, skipped: 0, failed: 0", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/Synchronized/Experiment_3/baseline/test01.dat" % (self.staging, self.token))
+            self.assertEquals(446 + len("modified"), path.stat().st_size, output)
+
+        print("Upload large file in chunks")
+        large_file = "%s/large_file.dat" % self.tempdir
+        with open(large_file, "wb") as f:
+            f.write(os.urandom(12 * 1048576))
+        cmd = "IDA_CHUNKED_UPLOAD_THRESHOLD=10 IDA_CHUNK_SIZE=5 %s upload %s /test%s/Chunked/large_file.dat %s" % (self.cli_cmd, self.args, self.token, large_file)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Uploading chunk 1 of 3 of file %s" % large_file, output)
+        self.assertIn("Uploading chunk 3 of 3 of file %s" % large_file, output)
+        self.assertIn("Target uploaded successfully", output)
+        if self.run_localized_tests:
+            path = Path("%s/test%s/Chunked/large_file.dat" % (self.staging, self.token))
+            self.assertTrue(path.is_file(), output)
+            self.assertEquals(12 * 1048576, path.stat().st_size, output)
+        path = Path("%s/cache/uploads" % self.tempdir)
+        self.assertEquals([], list(path.iterdir()), output)
+
+        print("Download large file in parallel segments")
+        cmd = "IDA_SEGMENTED_DOWNLOAD_THRESHOLD=10 %s download %s -P 4 /test%s/Chunked/large_file.dat %s/large_file_download.dat" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Downloading file in 4 segments of 3145728 bytes", output)
+        self.assertIn("Downloaded file verified by checksum", output)
+        self.assertIn("Target downloaded successfully", output)
+        with open(large_file, "rb") as f1, open("%s/large_file_download.dat" % self.tempdir, "rb") as f2:
+            self.assertTrue(f1.read() == f2.read(), output)
+
+        print("Download large file in parallel segments when a range request is answered with the entire file")
+        proxy = FailingProxy(self.ida_host, "/large_file.dat", ignore_range=True)
+        f = open("%s/ida-config-proxy" % self.tempdir, "w")
+        f.write("IDA_HOST=\"%s\"\n" % proxy.host)
+        f.write("IDA_PROJECT=\"%s\"\n" % self.test_project_name)
+        f.write("IDA_USERNAME=\"%s\"\n" % self.test_user_name)
+        f.close()
+        cmd = "IDA_SEGMENTED_DOWNLOAD_THRESHOLD=10 IDA_PASSWORD=\"%s\" %s download -V -c %s/ida-config-proxy -P 4 /test%s/Chunked/large_file.dat %s/large_file_download2.dat" % (self.test_user_pass, self.cli_cmd, self.tempdir, self.token, self.tempdir)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: GET request failed for segment", output)
+            self.assertIn(": 200", output)
+        self.assertTrue(failed, output)
+        path = Path("%s/large_file_download2.dat.part" % self.tempdir)
+        self.assertEquals(12 * 1048576, path.stat().st_size, output)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        finally:
+            proxy.stop()
+        self.assertIn("Resuming interrupted download to %s" % (path), output)
+        self.assertEquals(3, output.count("already downloaded"), output)
+        self.assertIn("Downloaded file verified by checksum", output)
+        with open(large_file, "rb") as f1, open("%s/large_file_download2.dat" % self.tempdir, "rb") as f2:
+            self.assertTrue(f1.read() == f2.read(), output)
+
         print("Upload folder with files containing special characters")
         cmd = "%s upload %s /test%s/Special\ Characters %s/Special\ Characters" % (self.cli_cmd, self.args, self.token, self.testdata)
         try:
@@ -1602,6 +2228,48 @@ class TestIdaCli(unittest.TestCase):
             self.assertTrue(path.is_file(), output)
             self.assertEquals(446, path.stat().st_size, output)
 
+        print("Upload existing folder with files containing special characters, which will skip all files")
+        cmd = "%s upload %s /test%s/Special\ Characters %s/Special\ Characters" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Skipping existing file %s/Special Characters/file_with_ä_and_ö_and_even_å_oh_my.dat" % self.testdata, output)
+        self.assertIn("Skipping existing file %s/Special Characters/$file with special characters #~;@-+'&!%%^.dat" % self.testdata, output)
+        self.assertIn("WARNING: one or more files were skipped", output)
+
+        print("Retrieve info of folder with files containing special characters as JSON")
+        cmd = "%s info %s -j /test%s/Special\ Characters" % (self.cli_cmd, self.info_args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        info = json.loads(output)
+        self.assertEqual("folder", info["type"], output)
+        self.assertIn("/test%s/Special Characters/file_with_ä_and_ö_and_even_å_oh_my.dat" % (self.token), info["contents"], output)
+        self.assertIn("/test%s/Special Characters/file with spaces and (various) [brackets] {etc}" % (self.token), info["contents"], output)
+        self.assertIn("/test%s/Special Characters/$file with special characters #~;@-+'&!%%^.dat" % (self.token), info["contents"], output)
+
+        print("Upload and validate folder with backslashes in local pathnames")
+        backslash_folder = "%s/back\\slash" % self.tempdir
+        os.makedirs("%s/sub\\x" % backslash_folder)
+        shutil.copyfile("%s/Contact.txt" % self.testdata, "%s/a\\nb.txt" % backslash_folder)
+        shutil.copyfile("%s/Contact.txt" % self.testdata, "%s/sub\\x/Contact.txt" % backslash_folder)
+        cmd = "%s upload %s /test%s/Backslash '%s'" % (self.cli_cmd, self.args, self.token, backslash_folder)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Target uploaded successfully", output)
+        cmd = "%s validate %s /test%s/Backslash '%s'" % (self.cli_cmd, self.args, self.token, backslash_folder)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("FILE_OK: local file %s/a\\nb.txt matches file in IDA at /%s+/test%s/Backslash/a\\nb.txt" % (backslash_folder, self.test_project_name, self.token), output)
+        self.assertIn("FILE_OK: local file %s/sub\\x/Contact.txt matches file in IDA at /%s+/test%s/Backslash/sub\\x/Contact.txt" % (backslash_folder, self.test_project_name, self.token), output)
+        self.assertNotIn("MISSING", output)
+
         print("Copy folder within staging area with dry-run parameter and verify no actual copy occurred")
         cmd = "%s copy %s -D /test%s/2017-10/Experiment_3/baseline /test%s/2017-11/Experiment_8/baseline" % (self.cli_cmd, self.args, self.token, self.token)
         try:
@@ -1791,6 +2459,74 @@ class TestIdaCli(unittest.TestCase):
             self.assertTrue(path.is_file(), output)
             self.assertEquals(16868, path.stat().st_size, output)
 
+        print("Download folder as individual files using parallel workers")
+        cmd = "%s download %s -m -P 4 /test%s/2017-10/Experiment_5 %s/2017-10_Experiment_5" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Remote listing of /%s+/test%s/2017-10/Experiment_5 contains" % (self.test_project_name, self.token), output)
+        self.assertIn("Files downloaded: 10, skipped: 0, failed: 0", output)
+        self.assertIn("Target downloaded successfully", output)
+        path = Path("%s/2017-10_Experiment_5/baseline/test01.dat" % (self.tempdir))
+        self.assertTrue(path.is_file(), output)
+        self.assertEquals(446, path.stat().st_size, output)
+        path = Path("%s/2017-10_Experiment_5/baseline/test01.dat.part" % (self.tempdir))
+        self.assertFalse(path.exists(), output)
+
+        print("Download only new and modified files to existing local folder")
+        os.remove("%s/2017-10_Experiment_5/baseline/test01.dat" % (self.tempdir))
+        with open("%s/2017-10_Experiment_5/baseline/test02.dat" % (self.tempdir), "a") as f:
+            f.write("modified")
+        cmd = "%s download %s -m /test%s/2017-10/Experiment_5 %s/2017-10_Experiment_5" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Downloading only new and modified files to existing folder %s/2017-10_Experiment_5" % (self.tempdir), output)
+        self.assertIn("Files downloaded: 2, skipped: 8, failed: 0", output)
+        path = Path("%s/2017-10_Experiment_5/baseline/test01.dat" % (self.tempdir))
+        self.assertTrue(path.is_file(), output)
+        self.assertEquals(446, path.stat().st_size, output)
+        path = Path("%s/2017-10_Experiment_5/baseline/test02.dat" % (self.tempdir))
+        self.assertEquals(1531, path.stat().st_size, output)
+
+        print("Download folder extracting package while downloading")
+        cmd = "%s download %s -x /test%s/2017-10/Experiment_5 %s/2017-10_Experiment_5_extracted" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Target downloaded successfully", output)
+        path = Path("%s/2017-10_Experiment_5_extracted/baseline/test01.dat" % (self.tempdir))
+        self.assertTrue(path.is_file(), output)
+        self.assertEquals(446, path.stat().st_size, output)
+        path = Path("%s/2017-10_Experiment_5_extracted.part" % (self.tempdir))
+        self.assertFalse(path.exists(), output)
+        self.assertIn("Verifying extracted files against listing of /%s+/test%s/2017-10/Experiment_5" % (self.test_project_name, self.token), output)
+
+        print("Attempt to download folder extracting package while downloading using parallel workers")
+        cmd = "%s download %s -x -P 4 /test%s/2017-10/Experiment_5 %s/2017-10_Experiment_5_parallel" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -P and -x options cannot be used together", output)
+        self.assertTrue(failed, output)
+
+        print("Attempt to download file extracting package while downloading")
+        cmd = "%s download %s -x /test%s/2017-10/Experiment_5/baseline/test01.dat %s/test01_extracted.dat" % (self.cli_cmd, self.args, self.token, self.tempdir)
+        failed = False
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            failed = True
+            output = error.output.decode(sys.stdout.encoding)
+            self.assertIn("Error: The -x option is only allowed when downloading a folder", output)
+        self.assertTrue(failed, output)
+
         print("Attempt to upload folder using invalid local pathname")
         cmd = "%s upload %s /test%s/no/such/folder /no/such/folder" % (self.cli_cmd, self.args, self.token)
         failed = False
@@ -1993,6 +2729,22 @@ class TestIdaCli(unittest.TestCase):
         self.assertIn("  /test%s/2017-12/Experiment_1/baseline/zero_size_file" % (self.token), output)
         self.assertNotIn(":href>", output)
 
+        print("Retrieve recursive folder info from frozen area as JSON")
+        cmd = "%s info %s -f -r -j /test%s/2017-12" % (self.cli_cmd, self.info_args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        info = json.loads(output)
+        self.assertEqual("folder", info["type"], output)
+        self.assertEqual(11297, info["size"], output)
+        self.assertEqual(6, info["files"], output)
+        self.assertEqual([
+            {"pathname": "/test%s/2017-12" % (self.token), "size": 11297, "files": 6},
+            {"pathname": "/test%s/2017-12/Experiment_1" % (self.token), "size": 11297, "files": 6},
+            {"pathname": "/test%s/2017-12/Experiment_1/baseline" % (self.token), "size": 11297, "files": 6}
+        ], info["folders"], output)
+
         print("Attempt to retrieve file info from staging area using invalid target pathname")
         cmd = "%s info %s /test%s/no/such/file.txt" % (self.cli_cmd, self.info_args, self.token)
         failed = False
@@ -2037,6 +2789,127 @@ class TestIdaCli(unittest.TestCase):
             self.assertIn("Error: Specified target not found", output)
         self.assertTrue(failed, output)
 
+        print("--- Inventory Operations")
+
+        print("Retrieve inventory of frozen folder as newline delimited JSON with selected fields")
+        cmd = "%s inventory %s -l -k pathname,area,size,checksum /test%s/2017-12/Experiment_1/baseline" % (self.cli_cmd, self.info_args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(6, len(records), output)
+        for record in records:
+            self.assertEqual(["pathname", "area", "size", "checksum"], list(record.keys()), output)
+            self.assertTrue(record["pathname"].startswith("/test%s/2017-12/Experiment_1/baseline/" % (self.token)), output)
+            self.assertEqual("frozen", record["area"], output)
+        self.assertIn({
+            "pathname": "/test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.token),
+            "area": "frozen",
+            "size": 446,
+            "checksum": "sha256:56293a80e0394d252e995f2debccea8223e4b5b2b150bee212729b3b39ac4d46"
+        }, records)
+
+        print("Revalidate inventory snapshot")
+        cmd = "%s inventory %s -l /test%s/2017-12/Experiment_1/baseline" % (self.cli_cmd, self.args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Revalidating inventory snapshot of project %s" % (self.test_project_name), output)
+        self.assertIn("/test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.token), output)
+
+        print("Retrieve inventory changes of frozen folder for the first time")
+        cmd = "%s inventory %s -l -C -k pathname /test%s/2017-12/Experiment_1/baseline" % (self.cli_cmd, self.info_args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(6, len(records), output)
+        self.assertIn({"change": "added", "pathname": "/test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.token)}, records)
+
+        print("Retrieve inventory changes of unchanged frozen folder")
+        cmd = "%s inventory %s -l -C /test%s/2017-12/Experiment_1/baseline" % (self.cli_cmd, self.args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Files added: 0, removed: 0, changed: 0", output)
+        self.assertNotIn("\"change\":", output)
+
+        print("Retrieve file info from frozen area using inventory snapshot")
+        cmd = "%s info %s -f /test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.cli_cmd, self.args, self.token)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Using inventory snapshot of project %s" % (self.test_project_name), output)
+        self.assertIn("pathname:   /test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.token), output)
+        self.assertIn("size:       446", output)
+        self.assertIn("checksum:   sha256:56293a80e0394d252e995f2debccea8223e4b5b2b150bee212729b3b39ac4d46", output)
+        self.assertIn("uploaded:   ", output)
+        self.assertNotIn("PROPFIND", output)
+
+        print("Retrieve file info from inventory snapshot record with empty fields")
+        snapshot = Path("%s/cache/inventories/%s" % (self.tempdir, hashlib.sha256(("%s/%s" % (self.ida_host, self.test_project_name)).encode()).hexdigest()))
+        self.assertTrue(snapshot.is_file())
+        original = snapshot.read_text()
+        records = []
+        for record in original.splitlines():
+            fields = record.split("\t")
+            if fields[0] == "frozen" and fields[1] == "/test%s/2017-12/Experiment_1/baseline/test01.dat" % (self.token):
+                fields[3] = ""
+                fields[4] = ""
+                frozen = fields[6]
+            records.append("\t".join(fields))
+        snapshot.write_text("\n".join(records) + "\n")
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+            validate_cmd = "%s validate %s -f /test%s/2017-12/Experiment_1/baseline/test01.dat %s/2017-08/Experiment_1/baseline/test01.dat" % (self.cli_cmd, self.args, self.token, self.testdata)
+            validate_output = subprocess.check_output(validate_cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        finally:
+            snapshot.write_text(original)
+        self.assertIn("Using inventory snapshot of project %s" % (self.test_project_name), output)
+        self.assertNotIn("pid:", output)
+        self.assertNotIn("modified:", output)
+        self.assertIn("uploaded:   2018-11-01T00:00:00Z", output)
+        self.assertIn("frozen:     %s" % (frozen), output)
+        self.assertIn("checksum:   sha256:56293a80e0394d252e995f2debccea8223e4b5b2b150bee212729b3b39ac4d46", output)
+        self.assertIn("size:       446", output)
+        self.assertIn("were taken from the local inventory snapshot", validate_output)
+        self.assertNotIn("no checksum reported", validate_output)
+        self.assertNotIn("INVALID:", validate_output)
+
+        print("Validate frozen folder using inventory snapshot")
+        cmd = "%s validate %s -f /test%s/2017-12/Experiment_1/baseline %s/2017-08/Experiment_1/baseline" % (self.cli_cmd, self.args, self.token, self.testdata)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("Inventory snapshot listing of /%s/test%s/2017-12/Experiment_1/baseline contains 6 entries" % (self.test_project_name, self.token), output)
+        self.assertNotIn("Remote listing of", output)
+        self.assertNotIn("INVALID:", output)
+        self.assertNotIn("MISSING:", output)
+        self.assertIn("WARNING: files in IDA at /%s/test%s/2017-12/Experiment_1/baseline were taken from the local inventory snapshot of project %s" % (self.test_project_name, self.token, self.test_project_name), output)
+
+        print("Validate frozen folder with local file not found in inventory snapshot")
+        validate_folder = "%s/validate-snapshot" % self.tempdir
+        shutil.copytree("%s/2017-08/Experiment_1/baseline" % self.testdata, validate_folder)
+        shutil.copy("%s/2017-08/Experiment_1/test01.dat" % self.testdata, "%s/extra.dat" % validate_folder)
+        cmd = "%s validate %s -f /test%s/2017-12/Experiment_1/baseline %s" % (self.cli_cmd, self.args, self.token, validate_folder)
+        try:
+            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode(sys.stdout.encoding)
+        except subprocess.CalledProcessError as error:
+            self.fail(error.output.decode(sys.stdout.encoding))
+        self.assertIn("1 local files not found in inventory snapshot, retrieving listing of /%s/test%s/2017-12/Experiment_1/baseline from the service" % (self.test_project_name, self.token), output)
+        self.assertIn("Remote listing of", output)
+        self.assertNotIn("were taken from the local inventory snapshot", output)
+        self.assertIn("MISSING: local file %s/extra.dat" % validate_folder, output)
+        self.assertNotIn("INVALID:", output)
+
         if self.run_trusted_tests:
 
             print("--- Locking and Scope Collisions")